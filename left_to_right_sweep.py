@@ -1,65 +1,79 @@
 import numpy as np
-from scipy.sparse.linalg import eigs
+from scipy.sparse import kron, identity
+from scipy.sparse.linalg import eigsh
+from add_site import add_site
 
 def left_to_right_sweep(Model, operators_type, BlockH, BlockHR, I, int_param,
                          Op_block1, Op_block1R, Op_local1, I_block, I_blockR,
-                         m, TruncationError, Measure, N):
+                         m, TruncationError, Measure, BlockN, BlockNR,
+                         Op_block2, Op_block2R, Op_local2):
     
+    N_local = Op_local1.T @ Op_local1 + Op_local2.T @ Op_local2
+
     if operators_type == 'spinless':
-        BlockH2 = np.kron(BlockH, I) + int_param * np.kron(Op_block1.T, Op_local1) + int_param * np.kron(Op_block1, Op_local1.T)
-        BlockHR2 = np.kron(BlockHR, I) + int_param * np.kron(Op_block1R.T, Op_local1) + int_param * np.kron(Op_block1R, Op_local1.T)
-        Op_block12, I_block2, Op_block22 = add_site(Model, Op_block1, I_block)
-        Op_block1R2, I_blockR2, Op_block2R2 = add_site(Model, Op_block1R, I_blockR)
+        BlockH2 = kron(BlockH, I) + int_param * kron(Op_block1.T, Op_local1) + int_param * kron(Op_block1, Op_local1.T)
+        BlockHR2 = kron(BlockHR, I) + int_param * kron(Op_block1R.T, Op_local1) + int_param * kron(Op_block1R, Op_local1.T)
     
     elif operators_type == 'spinfull':
-        BlockH2 = np.kron(BlockH, I) + int_param * apply_jw_transform(Op_block1.T, Op_local1) + int_param * apply_jw_transform(Op_block1, Op_local1.T)
-        BlockHR2 = np.kron(BlockHR, I) + int_param * apply_jw_transform(Op_block1R.T, Op_local1) + int_param * apply_jw_transform(Op_block1R, Op_local1.T)
-        Op_block12, I_block2, Op_block22 = add_site(Model, Op_block1, I_block, spinfull=True)
-        Op_block1R2, I_blockR2, Op_block2R2 = add_site(Model, Op_block1R, I_blockR, spinfull=True)
+        BlockH2 = (kron(BlockH, I) + int_param * (kron(Op_block1.T, Op_local1) + kron(Op_block1, Op_local1.T))
+                   + int_param * (kron(Op_block2.T, Op_local2) + kron(Op_block2, Op_local2.T)))
+        BlockHR2 = (kron(BlockHR, I) + int_param * (kron(Op_block1R.T, Op_local1) + kron(Op_block1R, Op_local1.T))
+                    + int_param * (kron(Op_block2R.T, Op_local2) + kron(Op_block2R, Op_local2.T)))
     
     else:
         raise ValueError("Model type not yet implemented")
+
+    Op_block12, I_block2, Op_block22 = add_site(I_block, I, Op_local1, Op_local2)
+    Op_block1R2, I_blockR2, Op_block2R2 = add_site(I_blockR, I, Op_local1, Op_local2)
+    BlockN2 = kron(BlockN, I) + kron(I_block, N_local)
+    BlockNR2 = kron(BlockNR, I) + kron(I_blockR, N_local)
     
-    H_super = np.kron(BlockH2, I_blockR2) + np.kron(I_block2, BlockHR2) + int_param * apply_jw_transform(Op_block12.T, Op_block2R2) + int_param * apply_jw_transform(Op_block12, Op_block2R2.T)
+    H_super = (kron(BlockH2, I_blockR2) + kron(I_block2, BlockHR2)
+               + int_param * (kron(Op_block12.T, Op_block1R2) + kron(Op_block12, Op_block1R2.T))
+               + int_param * (kron(Op_block22.T, Op_block2R2) + kron(Op_block22, Op_block2R2.T)))
     
-    Psi, Energy = eigs(H_super, k=1, which='SM')
+    Energy, Psi = eigsh(H_super, k=1, which='SA')
     
     DimL, DimR = BlockH2.shape[1], BlockHR2.shape[1]
-    if m < DimL:
-        PsiMatrix = Psi.reshape(DimR, DimL)
-        RhoL = PsiMatrix.T @ PsiMatrix
-        RhoR = PsiMatrix @ PsiMatrix.T
+    PsiMatrix = Psi.reshape(DimL, DimR)
+    RhoL = PsiMatrix @ PsiMatrix.T
+    RhoR = PsiMatrix.T @ PsiMatrix
 
-        VL, DL = np.linalg.eigh(RhoL)
-        IndexL = np.argsort(DL)[::-1]
-        VL = VL[:, IndexL]
+    # Measure on the enlarged blocks before they are truncated
+    if Measure == 'N':
+        N2 = float(np.trace(BlockN2 @ RhoL) + np.trace(BlockNR2 @ RhoR))
+    else:
+        raise ValueError("Measurement type not implemented")
 
-        VR, DR = np.linalg.eigh(RhoR)
-        IndexR = np.argsort(DR)[::-1]
-        VR = VR[:, IndexR]
+    if m < DimL:
+        DL, VL = np.linalg.eigh(RhoL)
+        IndexL = np.argsort(DL)[::-1]
+        DL, VL = DL[IndexL], VL[:, IndexL]
 
-        NKeepL, NKeepR = min(DL.shape[0], m), min(DR.shape[0], m)
-        TL, TR = VL[:, :NKeepL], VR[:, :NKeepR]
-        TruncationError += (1 - np.sum(DL[:NKeepL])) + (1 - np.sum(DR[:NKeepR]))
+        NKeepL = min(DL.shape[0], m)
+        TL = VL[:, :NKeepL]
+        TruncationError += 1 - np.sum(DL[:NKeepL])
 
         BlockH2 = TL.T @ BlockH2 @ TL
         Op_block12 = TL.T @ Op_block12 @ TL
         Op_block22 = TL.T @ Op_block22 @ TL
-        I_block2 = TL.T @ I_block2 @ TL
+        BlockN2 = TL.T @ BlockN2 @ TL
+        I_block2 = identity(NKeepL, format='csr')
+
+    if m < DimR:
+        DR, VR = np.linalg.eigh(RhoR)
+        IndexR = np.argsort(DR)[::-1]
+        DR, VR = DR[IndexR], VR[:, IndexR]
+
+        NKeepR = min(DR.shape[0], m)
+        TR = VR[:, :NKeepR]
+        TruncationError += 1 - np.sum(DR[:NKeepR])
 
         BlockHR2 = TR.T @ BlockHR2 @ TR
         Op_block1R2 = TR.T @ Op_block1R2 @ TR
         Op_block2R2 = TR.T @ Op_block2R2 @ TR
-        I_blockR2 = TR.T @ I_blockR2 @ TR
+        BlockNR2 = TR.T @ BlockNR2 @ TR
+        I_blockR2 = identity(NKeepR, format='csr')
     
-    if Measure == 'N':
-        N2 = N + np.trace((Op_block12.T @ Op_block12) @ RhoL) + np.trace((Op_block1R2.T @ Op_block1R2) @ RhoR)
-    else:
-        raise ValueError("Measurement type not implemented")
-    
-    return Psi, Energy, BlockH2, BlockHR2, Op_block12, Op_block1R2, Op_block22, Op_block2R2, I_block2, I_blockR2, TruncationError, N2
-
-def apply_jw_transform(op1, op2):
-    sign_factor = np.kron(np.identity(op1.shape[0]), np.identity(op2.shape[1]))
-    return sign_factor @ np.kron(op1, op2)
-
+    return (Psi, Energy, BlockH2, BlockHR2, Op_block12, Op_block1R2, Op_block22, Op_block2R2, I_block2, I_blockR2,
+            BlockN2, BlockNR2, TruncationError, N2)
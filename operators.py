@@ -28,7 +28,7 @@ def operators(operators_type):
 
         # Fermion annihilation operator (destroys a particle at a site)
         # Basis: |0⟩ (empty), |1⟩ (occupied)
-        Cup = sp.csr_matrix((2, 2))  # Initialize a 2x2 sparse matrix with zeros
+        Cup = sp.lil_matrix((2, 2))  # Initialize a 2x2 sparse matrix with zeros
         Cup[0, 1] = 1  # Converts |1⟩ → |0⟩ (annihilation)
 
         # Not needed for spinless fermions, but included for consistency
@@ -43,18 +43,19 @@ def operators(operators_type):
         # Cup removes a spin-up fermion:
         # |↑⟩ → |0⟩  (position [0,2])
         # |↑↓⟩ → |↓⟩ (position [1,3])
-        Cup = sp.csr_matrix((4, 4))
+        Cup = sp.lil_matrix((4, 4))
         Cup[0, 2] = 1  # |↑⟩ → |0⟩
         Cup[1, 3] = 1  # |↑↓⟩ → |↓⟩
 
         # Spin-down annihilation operator
         # |↓⟩ → |0⟩  (position [0,1])
         # |↑↓⟩ → |↑⟩ (position [2,3])
-        Cdown = sp.csr_matrix((4, 4))
+        Cdown = sp.lil_matrix((4, 4))
         Cdown[0, 1] = 1  # |↓⟩ → |0⟩
         Cdown[2, 3] = 1  # |↑↓⟩ → |↑⟩
 
     else:
         raise ValueError("Error: Unknown operators type. Use 'spinless' or 'spinfull'.")
 
-    return I, Cup, Cdown  # Return the identity and annihilation operators
+    # Entries are set on LIL matrices, which is cheap, then converted to CSR
+    return I, sp.csr_matrix(Cup), sp.csr_matrix(Cdown)  # Return the identity and annihilation operators
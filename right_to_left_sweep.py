@@ -1,60 +1,79 @@
 import numpy as np
-from scipy.sparse.linalg import eigs
+from scipy.sparse import kron, identity
+from scipy.sparse.linalg import eigsh
+from add_site import add_site
 
 def right_to_left_sweep(Model, operators_type, BlockH, BlockHL, I, int_param,
                          Op_block1, Op_block1L, Op_local1, I_block, I_blockL,
-                         m, TruncationError):
+                         m, TruncationError, Measure, BlockN, BlockNL,
+                         Op_block2, Op_block2L, Op_local2):
     
+    N_local = Op_local1.T @ Op_local1 + Op_local2.T @ Op_local2
+
     if operators_type == 'spinless':
-        BlockH2 = np.kron(BlockH, I) + int_param * np.kron(Op_block1.T, Op_local1) + int_param * np.kron(Op_block1, Op_local1.T)
-        BlockHL2 = np.kron(BlockHL, I) + int_param * np.kron(Op_block1L.T, Op_local1) + int_param * np.kron(Op_block1L, Op_local1.T)
-        Op_block12, I_block2, Op_block22 = add_site(Model, Op_block1, I_block)
-        Op_block1L2, I_blockL2, Op_block2L2 = add_site(Model, Op_block1L, I_blockL)
+        BlockH2 = kron(BlockH, I) + int_param * kron(Op_block1.T, Op_local1) + int_param * kron(Op_block1, Op_local1.T)
+        BlockHL2 = kron(BlockHL, I) + int_param * kron(Op_block1L.T, Op_local1) + int_param * kron(Op_block1L, Op_local1.T)
     
     elif operators_type == 'spinfull':
-        BlockH2 = np.kron(BlockH, I) + int_param * apply_jw_transform(Op_block1.T, Op_local1) + int_param * apply_jw_transform(Op_block1, Op_local1.T)
-        BlockHL2 = np.kron(BlockHL, I) + int_param * apply_jw_transform(Op_block1L.T, Op_local1) + int_param * apply_jw_transform(Op_block1L, Op_local1.T)
-        Op_block12, I_block2, Op_block22 = add_site(Model, Op_block1, I_block, spinfull=True)
-        Op_block1L2, I_blockL2, Op_block2L2 = add_site(Model, Op_block1L, I_blockL, spinfull=True)
+        BlockH2 = (kron(BlockH, I) + int_param * (kron(Op_block1.T, Op_local1) + kron(Op_block1, Op_local1.T))
+                   + int_param * (kron(Op_block2.T, Op_local2) + kron(Op_block2, Op_local2.T)))
+        BlockHL2 = (kron(BlockHL, I) + int_param * (kron(Op_block1L.T, Op_local1) + kron(Op_block1L, Op_local1.T))
+                    + int_param * (kron(Op_block2L.T, Op_local2) + kron(Op_block2L, Op_local2.T)))
     
     else:
         raise ValueError("Model type not yet implemented")
+
+    Op_block12, I_block2, Op_block22 = add_site(I_block, I, Op_local1, Op_local2)
+    Op_block1L2, I_blockL2, Op_block2L2 = add_site(I_blockL, I, Op_local1, Op_local2)
+    BlockN2 = kron(BlockN, I) + kron(I_block, N_local)
+    BlockNL2 = kron(BlockNL, I) + kron(I_blockL, N_local)
     
-    H_super = np.kron(BlockHL2, I_block2) + np.kron(I_blockL2, BlockH2) + int_param * apply_jw_transform(Op_block1L2.T, Op_block22) + int_param * apply_jw_transform(Op_block1L2, Op_block22.T)
+    H_super = (kron(BlockHL2, I_block2) + kron(I_blockL2, BlockH2)
+               + int_param * (kron(Op_block1L2.T, Op_block12) + kron(Op_block1L2, Op_block12.T))
+               + int_param * (kron(Op_block2L2.T, Op_block22) + kron(Op_block2L2, Op_block22.T)))
     
-    Psi, Energy = eigs(H_super, k=1, which='SM')
+    Energy, Psi = eigsh(H_super, k=1, which='SA')
     
     DimL, DimR = BlockHL2.shape[1], BlockH2.shape[1]
-    if m < DimR:
-        PsiMatrix = Psi.reshape(DimR, DimL)
-        RhoL = PsiMatrix.T @ PsiMatrix
-        RhoR = PsiMatrix @ PsiMatrix.T
+    PsiMatrix = Psi.reshape(DimL, DimR)
+    RhoL = PsiMatrix @ PsiMatrix.T
+    RhoR = PsiMatrix.T @ PsiMatrix
 
-        VL, DL = np.linalg.eigh(RhoL)
-        IndexL = np.argsort(DL)[::-1]
-        VL = VL[:, IndexL]
+    # Measure on the enlarged blocks before they are truncated
+    if Measure == 'N':
+        N2 = float(np.trace(BlockNL2 @ RhoL) + np.trace(BlockN2 @ RhoR))
+    else:
+        raise ValueError("Measurement type not implemented")
 
-        VR, DR = np.linalg.eigh(RhoR)
+    if m < DimR:
+        DR, VR = np.linalg.eigh(RhoR)
         IndexR = np.argsort(DR)[::-1]
-        VR = VR[:, IndexR]
+        DR, VR = DR[IndexR], VR[:, IndexR]
 
-        NKeepL, NKeepR = min(DL.shape[0], m), min(DR.shape[0], m)
-        TL, TR = VL[:, :NKeepL], VR[:, :NKeepR]
-        TruncationError += (1 - np.sum(DL[:NKeepL])) + (1 - np.sum(DR[:NKeepR]))
+        NKeepR = min(DR.shape[0], m)
+        TR = VR[:, :NKeepR]
+        TruncationError += 1 - np.sum(DR[:NKeepR])
 
         BlockH2 = TR.T @ BlockH2 @ TR
         Op_block12 = TR.T @ Op_block12 @ TR
         Op_block22 = TR.T @ Op_block22 @ TR
-        I_block2 = TR.T @ I_block2 @ TR
+        BlockN2 = TR.T @ BlockN2 @ TR
+        I_block2 = identity(NKeepR, format='csr')
+
+    if m < DimL:
+        DL, VL = np.linalg.eigh(RhoL)
+        IndexL = np.argsort(DL)[::-1]
+        DL, VL = DL[IndexL], VL[:, IndexL]
+
+        NKeepL = min(DL.shape[0], m)
+        TL = VL[:, :NKeepL]
+        TruncationError += 1 - np.sum(DL[:NKeepL])
 
         BlockHL2 = TL.T @ BlockHL2 @ TL
         Op_block1L2 = TL.T @ Op_block1L2 @ TL
         Op_block2L2 = TL.T @ Op_block2L2 @ TL
-        I_blockL2 = TL.T @ I_blockL2 @ TL
+        BlockNL2 = TL.T @ BlockNL2 @ TL
+        I_blockL2 = identity(NKeepL, format='csr')
     
-    return Psi, Energy, BlockH2, BlockHL2, Op_block12, Op_block1L2, Op_block22, Op_block2L2, I_block2, I_blockL2, TruncationError
-
-def apply_jw_transform(op1, op2):
-    sign_factor = np.kron(np.identity(op1.shape[0]), np.identity(op2.shape[1]))
-    return sign_factor @ np.kron(op1, op2)
-
+    return (Psi, Energy, BlockH2, BlockHL2, Op_block12, Op_block1L2, Op_block22, Op_block2L2, I_block2, I_blockL2,
+            BlockN2, BlockNL2, TruncationError, N2)
@@ -0,0 +1,216 @@
+from hamiltonian import hamiltonian
+from operators import operators
+from infinite_dmrg import infinite_dmrg
+from left_to_right_sweep import left_to_right_sweep
+from right_to_left_sweep import right_to_left_sweep
+
+# Observables the DMRG steps know how to measure
+MEASUREMENTS = ('N',)
+
+# Array backends the DMRG kernels are written for
+BACKENDS = ('numpy',)
+
+
+def read_input(filename="input.txt"):
+    """
+    Reads the DMRG parameters from an input file of ``key = value`` lines.
+
+    Full-line comments and trailing ``# ...`` comments are ignored.
+
+    Parameters:
+    -----------
+    filename : str
+        Path to the input file.
+
+    Returns:
+    --------
+    params : dict
+        The raw parameters as strings, keyed by name.
+    """
+    params = {}
+    with open(filename, "r") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if "=" in line:
+                key, value = line.split("=", 1)
+                params[key.strip()] = value.strip()
+    return params
+
+
+def model_parameters(Model, t=1):
+    """
+    Returns the hopping parameter and operators type used for ``Model``.
+
+    The sweeps only support a uniform hopping, so the dimerized SSH and SSHH
+    models are rejected until alternating hopping is implemented.
+    """
+    if Model == 'spinless':
+        int_param = -t
+        operators_type = 'spinless'
+    elif Model == 'Hubbard':
+        int_param = -t
+        operators_type = 'spinfull'
+    elif Model in ('SSH', 'SSHH'):
+        raise ValueError(f"Error: Model {Model} requires alternating hopping, which is not yet implemented")
+    else:
+        raise ValueError("Error: Unknown model")
+    return int_param, operators_type
+
+
+def run_dmrg(config):
+    """
+    Runs the infinite DMRG warm-up followed by the finite DMRG sweeps.
+
+    This has no side effects: nothing is read from or written to disk.
+
+    Parameters:
+    -----------
+    config : dict
+        Run parameters, as returned by ``read_input`` or given directly:
+        - "Model" : "spinless" or "Hubbard" (default "spinless"); "SSH" and
+          "SSHH" raise ``ValueError`` until alternating hopping is implemented.
+        - "m" : Number of states kept during the sweeps (default 10).
+        - "m_warm" : Number of states kept during the warm-up (default 10).
+        - "N_sweeps" : Number of finite DMRG sweeps (default 4).
+        - "L" : Total system size, even and at least 4 (default 4).
+        - "Measure" : Observable to measure, currently only "N" (default "N").
+        - "Backend" : Array backend, currently only "numpy" (default "numpy").
+
+    Returns:
+    --------
+    result : dict
+        - "Model", "L", "m", "m_warm", "N_sweeps", "Measure" : The parameters used.
+        - "energy" : The ground state energy of the last step.
+        - "truncation_error" : The accumulated truncation error.
+        - "observables" : Value of each observable in the last step, keyed by
+          name; "N" is the total particle number of the chain.
+        - "Psi" : The ground state wavefunction of the last step.
+        - "history" : One dict per DMRG step with its "stage" ("warmup",
+          "left_to_right" or "right_to_left"), "sweep", "energy",
+          "truncation_error" and the measured observable.
+    """
+    Model = config.get("Model", "spinless")
+    m = int(config.get("m", 10))
+    m_warm = int(config.get("m_warm", 10))
+    N_sweeps = int(config.get("N_sweeps", 4))
+    L = int(config.get("L", 4))
+    Measure = config.get("Measure", "N")
+    Backend = config.get("Backend", "numpy")
+
+    if L < 4 or L % 2:
+        raise ValueError("Error: L must be even and at least 4 to run DMRG")
+    if m < 1 or m_warm < 1:
+        raise ValueError("Error: m and m_warm must be positive")
+    if N_sweeps < 0:
+        raise ValueError("Error: N_sweeps must not be negative")
+    if Measure not in MEASUREMENTS:
+        raise ValueError(f"Error: Unknown observable '{Measure}'. Use one of: {', '.join(MEASUREMENTS)}")
+    if Backend not in BACKENDS:
+        raise ValueError(f"Error: Unknown backend '{Backend}'. Use one of: {', '.join(BACKENDS)}")
+
+    int_param, operators_type = model_parameters(Model)
+
+    # Initialize DMRG
+    Hloc = hamiltonian(Model)
+    BlockH = [Hloc]
+
+    I, Op_local1, Op_local2 = operators(operators_type)
+    Op_block1 = [Op_local1]
+    I_block = [I]
+    Op_block2 = [Op_local2]
+    BlockN = [Op_local1.T @ Op_local1 + Op_local2.T @ Op_local2]
+
+    TruncationError = 0
+    NIterWarm = L // 2 - 1
+    observables = {}
+    history = []
+
+    def record(stage, sweep):
+        history.append({
+            "stage": stage,
+            "sweep": sweep,
+            "energy": float(Energy[0]),
+            "truncation_error": TruncationError,
+            Measure: observables[Measure],
+        })
+
+    # Infinite DMRG Warm-up
+    for l in range(NIterWarm):
+        (Psi, Energy, BlockH_new, Op_block1_new, Op_block2_new, I_block_new, BlockN_new,
+         TruncationError, observables[Measure]) = infinite_dmrg(
+            Model, l, operators_type, BlockH[-1], I, int_param, Op_block1[-1], Op_local1, I_block[-1], m_warm, TruncationError,
+            Op_block2[-1], Op_local2, BlockN[-1], Measure
+        )
+        BlockH.append(BlockH_new)
+        Op_block1.append(Op_block1_new)
+        Op_block2.append(Op_block2_new)
+        I_block.append(I_block_new)
+        BlockN.append(BlockN_new)
+        record("warmup", None)
+
+    # Make room for the longer blocks built during the sweeps
+    for blocks in (BlockH, Op_block1, Op_block2, I_block, BlockN):
+        blocks.extend([None] * (L - 3 - len(blocks)))
+
+    # Finite DMRG Sweeps
+    for s in range(N_sweeps):
+        left = NIterWarm
+        right = NIterWarm - 2
+
+        while right > 0:
+            (Psi, Energy, BlockH[left + 1], BlockH[right + 1], Op_block1[left + 1], Op_block1[right + 1],
+             Op_block2[left + 1], Op_block2[right + 1], I_block[left + 1], I_block[right + 1],
+             BlockN[left + 1], BlockN[right + 1], TruncationError, observables[Measure]) = left_to_right_sweep(
+                Model, operators_type, BlockH[left], BlockH[right], I, int_param,
+                Op_block1[left], Op_block1[right], Op_local1, I_block[left], I_block[right],
+                m, TruncationError, Measure, BlockN[left], BlockN[right],
+                Op_block2[left], Op_block2[right], Op_local2
+            )
+            record("left_to_right", s)
+            left += 1
+            right -= 1
+
+        left -= 1
+        right += 1
+        while left > 0:
+            (Psi, Energy, BlockH[right + 1], BlockH[left + 1], Op_block1[right + 1], Op_block1[left + 1],
+             Op_block2[right + 1], Op_block2[left + 1], I_block[right + 1], I_block[left + 1],
+             BlockN[right + 1], BlockN[left + 1], TruncationError, observables[Measure]) = right_to_left_sweep(
+                Model, operators_type, BlockH[right], BlockH[left], I, int_param,
+                Op_block1[right], Op_block1[left], Op_local1, I_block[right], I_block[left],
+                m, TruncationError, Measure, BlockN[right], BlockN[left],
+                Op_block2[right], Op_block2[left], Op_local2
+            )
+            record("right_to_left", s)
+            left -= 1
+            right += 1
+
+        left += 1
+        right -= 1
+        while left <= right:
+            (Psi, Energy, BlockH[left + 1], BlockH[right + 1], Op_block1[left + 1], Op_block1[right + 1],
+             Op_block2[left + 1], Op_block2[right + 1], I_block[left + 1], I_block[right + 1],
+             BlockN[left + 1], BlockN[right + 1], TruncationError, observables[Measure]) = left_to_right_sweep(
+                Model, operators_type, BlockH[left], BlockH[right], I, int_param,
+                Op_block1[left], Op_block1[right], Op_local1, I_block[left], I_block[right],
+                m, TruncationError, Measure, BlockN[left], BlockN[right],
+                Op_block2[left], Op_block2[right], Op_local2
+            )
+            record("left_to_right", s)
+            left += 1
+            right -= 1
+
+    return {
+        "Model": Model,
+        "L": L,
+        "m": m,
+        "m_warm": m_warm,
+        "N_sweeps": N_sweeps,
+        "Measure": Measure,
+        "Backend": Backend,
+        "energy": float(Energy[0]),
+        "truncation_error": TruncationError,
+        "observables": observables,
+        "Psi": Psi,
+        "history": history,
+    }
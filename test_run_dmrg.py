@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import dmrg_main
+import dmrg_main_parallel
+from run_dmrg import read_input, run_dmrg
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_fermion_energy(L):
+    """Exact ground state energy of an open spinless chain with unit hopping."""
+    eps = -2 * np.cos(np.arange(1, L + 1) * np.pi / (L + 1))
+    return eps[eps < 0].sum()
+
+
+def test_import_does_not_load_jax():
+    code = "import sys, run_dmrg, dmrg_main, dmrg_main_parallel; assert 'jax' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True)
+
+
+def test_run_dmrg_touches_no_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_dmrg({"Model": "spinless", "L": 6, "m": 8, "m_warm": 8, "N_sweeps": 1})
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("Model, spin_factor, L", [
+    ("spinless", 1, 4),
+    ("spinless", 1, 6),
+    ("spinless", 1, 8),
+    ("Hubbard", 2, 4),
+    ("Hubbard", 2, 6),
+])
+def test_energy_matches_free_fermions(Model, spin_factor, L):
+    m = 64 if Model == "Hubbard" else 16
+    result = run_dmrg({"Model": Model, "L": L, "m": m, "m_warm": m, "N_sweeps": 2})
+    assert isinstance(result["energy"], float)
+    assert result["energy"] == pytest.approx(spin_factor * free_fermion_energy(L), abs=1e-8)
+    assert result["history"][-1]["energy"] == result["energy"]
+    # Half filling: one particle per site for each spin species
+    assert result["observables"]["N"] == pytest.approx(spin_factor * L / 2)
+
+
+def test_history_covers_warmup_and_sweeps():
+    result = run_dmrg({"Model": "spinless", "L": 8, "m": 16, "m_warm": 16, "N_sweeps": 1})
+    stages = [step["stage"] for step in result["history"]]
+    assert stages[:3] == ["warmup"] * 3
+    assert "left_to_right" in stages and "right_to_left" in stages
+    assert result["observables"]["N"] == pytest.approx(4.0)
+    # The warm-up grows the chain by two sites per step; sweeps keep all L sites
+    assert [step["N"] for step in result["history"][:3]] == pytest.approx([2.0, 3.0, 4.0])
+    assert all(step["N"] == pytest.approx(4.0) for step in result["history"][3:])
+
+
+def test_warmup_only_run_records_observables():
+    result = run_dmrg({"Model": "spinless", "L": 4})
+    assert [step["stage"] for step in result["history"]] == ["warmup"]
+    assert result["observables"]["N"] == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize("config", [
+    {"L": 2},
+    {"L": 7},
+    {"m": 0},
+    {"m_warm": 0},
+    {"N_sweeps": -1},
+    {"Measure": "Sz"},
+    {"Backend": "jax"},
+    {"Model": "SSH"},
+    {"Model": "SSHH"},
+    {"Model": "Heisenberg"},
+])
+def test_invalid_config_raises(config):
+    with pytest.raises(ValueError):
+        run_dmrg(config)
+
+
+def test_cli_writes_output(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("# comment\nModel = spinless  # inline comment\nL = 6\nm = 8\nm_warm = 8\nN_sweeps = 1\n")
+    output_file = tmp_path / "output.txt"
+
+    assert read_input(str(input_file))["Model"] == "spinless"
+    result = dmrg_main.main(str(input_file), str(output_file))
+    assert f"Ground state energy: {result['energy']:.6f} t" in output_file.read_text()
+
+
+def test_parallel_cli_is_deprecated_alias(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("Model = spinless\nL = 4\n")
+    output_file = tmp_path / "output.txt"
+
+    with pytest.warns(DeprecationWarning):
+        result = dmrg_main_parallel.main(str(input_file), str(output_file))
+    assert f"Ground state energy (in units of t): {result['energy']:.6f}" in output_file.read_text()